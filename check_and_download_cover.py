@@ -1,41 +1,148 @@
 import os
 import json
+import asyncio
+import functools
+import inspect
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
+from aiolimiter import AsyncLimiter
+import diskcache
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 import logging
 from PIL import Image
-from io import BytesIO
 from slugify import slugify
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 import base64
 import time
-import urllib.parse
-import discogs_client
+import shutil
 import unicodedata
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class ProviderError(Exception):
+    """Raised when a provider answers with an error payload instead of search results."""
+
 # Set up logging to capture errors and missing covers
 logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
 
 SPOTIFY_CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
 SPOTIFY_CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET")
 DEEZER_API_URL = "https://api.deezer.com/"
+DISCOGS_API_URL = "https://api.discogs.com/"
 DISCOGS_API_TOKEN = os.getenv("DISCOGS_API_TOKEN")
 MUSICBRAINZ_API_URL = "https://musicbrainz.org/ws/2/"
 LASTFM_API_KEY = os.getenv("LASTFM_API_KEY")
+CACHE_DIR = os.getenv("COVER_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "cover-dl"))
 
 # Common title variants to improve search results
-TITLE_VARIANTS = ["Deluxe", "Remastered", "Anniversary", "Special Edition", "Expanded Edition"]
+TITLE_VARIANTS = ("Deluxe", "Remastered", "Anniversary", "Special Edition", "Expanded Edition")
+# Suffixes appended to the album title, starting with the plain title
+TITLE_SUFFIXES = ("",) + tuple(f" {variant}" for variant in TITLE_VARIANTS)
 ALBUM_TYPES = ["album", "ep", "compilation", "live"]
 
-def rate_limit(delay: float = 2.0) -> None:
+# Maximum number of albums whose covers are looked up at the same time
+ALBUM_CONCURRENCY = 10
+
+# Number of covers downloaded and resized in parallel (Pillow releases the GIL while decoding and resizing)
+DOWNLOAD_WORKERS = 16
+
+# Spotify access tokens are valid for one hour; they are reused across runs until shortly before they expire
+SPOTIFY_TOKEN_FILE = os.path.join(CACHE_DIR, "spotify_token.json")
+SPOTIFY_TOKEN_TTL = 3600
+SPOTIFY_TOKEN_MARGIN = 60
+# Ensures a rejected token is replaced only once when many lookups notice it at the same time
+SPOTIFY_TOKEN_LOCK = asyncio.Lock()
+
+# Provider lookups are cached on disk; covers that were not found are retried sooner
+COVER_CACHE = diskcache.Cache(os.path.join(CACHE_DIR, "covers"))
+CACHE_HIT_TTL = 30 * 24 * 60 * 60
+CACHE_MISS_TTL = 24 * 60 * 60
+NOT_FOUND = ""
+
+# Shared session for the image downloads so TCP/TLS connections are reused
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+http_session.mount("http://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+# Token buckets matching the published rate limits of each provider (requests per second).
+# The buckets start empty and allow a burst of max_rate on top of the steady rate, so Deezer's
+# 50 requests per 5 seconds needs burst + 5 * rate <= 50.
+LIMITERS = {
+    "spotify": AsyncLimiter(3, 1),
+    "deezer": AsyncLimiter(8, 1),
+    "lastfm": AsyncLimiter(5, 1),
+    "discogs": AsyncLimiter(1, 1),
+    "musicbrainz": AsyncLimiter(1, 1),
+}
+
+async def fetch_json(session: aiohttp.ClientSession, provider: str, url: str, **kwargs) -> tuple[int, dict | None]:
+    """
+    Perform a rate limited GET request and decode the JSON response.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session to use for the request.
+        provider (str): The provider whose API is called, used for rate limiting.
+        url (str): The URL to request.
+        **kwargs: Additional arguments passed to ``session.get`` (headers, params, ...).
+
+    Returns:
+        tuple[int, dict | None]: The HTTP status code and the decoded JSON body, or None if nothing was found (404).
+
+    Raises:
+        aiohttp.ClientResponseError: For any other non-200 status, e.g. an invalid token (401/403),
+            throttling (429) or a server error, so the failure is not cached as a missing cover.
+    """
+    async with LIMITERS[provider]:
+        async with session.get(url, **kwargs) as response:
+            if response.status == 404:
+                return response.status, None
+            if response.status != 200:
+                response.raise_for_status()
+            return response.status, await response.json(content_type=None)
+
+def cached_cover(provider: str):
     """
-    Rate limit to avoid exceeding API call limits.
+    Cache the result of a cover lookup on disk.
+
+    The cache key is built from the provider and the normalized artist, album
+    and release year arguments of the decorated function. Found covers are
+    kept for 30 days, lookups without a result for one day. Lookups that
+    raise an exception, such as a rejected token or a server error, are not
+    cached, so only a provider that answered and had no match is recorded as
+    a missing cover.
 
     Args:
-        delay (float, optional): The time in seconds to wait between API calls. Defaults to 2.0.
+        provider (str): The name of the provider, used as part of the cache key.
     """
-    time.sleep(delay)
+    def decorator(fetch):
+        signature = inspect.signature(fetch)
+
+        @functools.wraps(fetch)
+        async def wrapper(*args, **kwargs):
+            arguments = signature.bind(*args, **kwargs).arguments
+            key = (provider, default_process(arguments['artist']), default_process(arguments['album']), arguments.get('release_year'))
+
+            cover_url = COVER_CACHE.get(key)
+            if cover_url is not None:
+                return cover_url or None
 
-def authenticate_spotify():
+            cover_url = await fetch(*args, **kwargs)
+            if cover_url:
+                COVER_CACHE.set(key, cover_url, expire=CACHE_HIT_TTL)
+            else:
+                COVER_CACHE.set(key, NOT_FOUND, expire=CACHE_MISS_TTL)
+            return cover_url
+        return wrapper
+    return decorator
+
+async def authenticate_spotify(session: aiohttp.ClientSession):
     """
     Authenticate with Spotify using client ID and secret.
 
@@ -50,31 +157,141 @@ def authenticate_spotify():
     data = {"grant_type": "client_credentials"}
 
     # Perform the POST request
-    response = requests.post(auth_url, headers=headers, data=data)
+    async with session.post(auth_url, headers=headers, data=data) as response:
+        # Check for a successful response
+        if response.status == 200:
+            # Return the Spotify token
+            return (await response.json()).get("access_token")
+
+        # Log the error if authentication fails
+        logging.error(f"Spotify authentication failed: {response.status} - {await response.text()}")
+    return None
 
-    # Check for a successful response
-    if response.status_code == 200:
-        # Return the Spotify token
-        return response.json().get("access_token")
+def load_cached_spotify_token() -> str | None:
+    """
+    Read the cached Spotify API token from SPOTIFY_TOKEN_FILE.
 
-    # Log the error if authentication fails
-    logging.error(f"Spotify authentication failed: {response.status_code} - {response.text}")
+    Returns:
+        str | None: The cached token if it belongs to the configured client and
+        is still valid for a while, or None if not.
+    """
+    try:
+        with open(SPOTIFY_TOKEN_FILE, 'r') as file:
+            cached = json.load(file)
+        if cached['client_id'] == SPOTIFY_CLIENT_ID and cached['expires_at'] > time.time() + SPOTIFY_TOKEN_MARGIN:
+            return cached['access_token']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
     return None
 
-def fuzzy_match(target: str, candidate: str, threshold: int = 85) -> bool:
+async def get_spotify_token(session: aiohttp.ClientSession):
+    """
+    Return a Spotify API token, reusing a cached token while it is still valid.
+
+    The token, its expiry time and the client ID it was issued for are stored
+    in SPOTIFY_TOKEN_FILE, so consecutive runs only authenticate again once the
+    token is about to expire or the client credentials change.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session to use if a new token is needed.
+
+    Returns:
+        str | None: The Spotify API token, or None if authentication failed.
+    """
+    spotify_token = load_cached_spotify_token()
+    if spotify_token:
+        return spotify_token
+
+    spotify_token = await authenticate_spotify(session)
+    if spotify_token:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # The token is a credential, so keep the file private to the current user
+            with open(os.open(SPOTIFY_TOKEN_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as file:
+                json.dump({"client_id": SPOTIFY_CLIENT_ID, "access_token": spotify_token,
+                           "expires_at": time.time() + SPOTIFY_TOKEN_TTL}, file)
+        except OSError as e:
+            logging.error(f"Could not cache Spotify token in {SPOTIFY_TOKEN_FILE}: {e}")
+    return spotify_token
+
+async def refresh_spotify_token(session: aiohttp.ClientSession, rejected_token: str):
+    """
+    Replace a Spotify API token that was rejected by the API.
+
+    The cached token file is removed and a new token is requested. If another
+    lookup already replaced the rejected token, its new token is reused.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session to use for authentication.
+        rejected_token (str): The token that Spotify answered with 401 Unauthorized.
+
+    Returns:
+        str | None: The new Spotify API token, or None if authentication failed.
+    """
+    async with SPOTIFY_TOKEN_LOCK:
+        spotify_token = load_cached_spotify_token()
+        if spotify_token and spotify_token != rejected_token:
+            return spotify_token
+
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(SPOTIFY_TOKEN_FILE)
+        return await get_spotify_token(session)
+
+def match_key(text: str) -> str:
+    """
+    Prepare a string for fuzzy matching.
+
+    The string is lowercased, stripped of non-alphanumeric characters and its
+    tokens are sorted, which is what the token sort ratio algorithm does to
+    both strings on every comparison. Computing the key once per string lets
+    fuzzy_match compare keys with a plain ratio.
+
+    Args:
+        text (str): The string to prepare.
+
+    Returns:
+        str: The match key for the string.
+    """
+    return " ".join(sorted(default_process(text).split()))
+
+def fuzzy_matches(target: str, candidates: list[str], threshold: int = 85) -> set[int]:
     """
-    Perform a fuzzy match between two strings using the token sort ratio algorithm.
+    Fuzzy match a target against a list of candidates using the token sort ratio algorithm.
+
+    All candidates are scored in a single RapidFuzz call instead of one Python
+    level comparison per candidate.
 
     Args:
-        target (str): The target string to compare against.
-        candidate (str): The candidate string to compare with the target.
+        target (str): The match key of the target string to compare against.
+        candidates (list[str]): The match keys of the candidate strings to compare with the target.
         threshold (int, optional): The minimum similarity score to consider a match. Defaults to 85.
 
     Returns:
-        bool: True if the fuzzy match ratio between the target and candidate exceeds the threshold, False otherwise.
+        set[int]: The indices of the candidates whose ratio reaches the threshold.
     """
-    return fuzz.token_sort_ratio(target, candidate) >= threshold
+    # The keys are already processed and token sorted, so a plain ratio equals the token sort ratio.
+    # RapidFuzz bails out early once the score can no longer reach the threshold; with score_cutoff
+    # it also rejects candidates whose length alone rules out a match, so no prefilter is needed.
+    matches = process.extract(target, candidates, scorer=fuzz.ratio, score_cutoff=threshold, limit=None)
+    return {index for _, _, index in matches}
+
+def quote_term(value: str) -> str:
+    """
+    Quote a value as a phrase for the search query syntax of the provider APIs.
+
+    Backslashes and double quotes inside the value are escaped, so names like
+    'Sinéad O'Connor' or 'The "Heroes" Tour' end up as a single search term.
 
+    Args:
+        value (str): The artist or album name to quote.
+
+    Returns:
+        str: The quoted value.
+    """
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+@functools.lru_cache(maxsize=4096)
 def normalize_artist_name(artist: str) -> str:
     """
     Normalize the artist name by removing accents and special characters.
@@ -93,11 +310,12 @@ def normalize_artist_name(artist: str) -> str:
     # Remove any special characters or accents
     return ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
 
-def get_spotify_artist_id(artist: str, spotify_token: str) -> str | None:
+async def get_spotify_artist_id(session: aiohttp.ClientSession, artist: str, spotify_token: str) -> str | None:
     """
     Fetch the Spotify artist ID using the artist's name.
 
     Args:
+        session (aiohttp.ClientSession): The HTTP session to use for the request.
         artist (str): The artist name to search for.
         spotify_token (str): The Spotify API token to use for authentication.
 
@@ -108,11 +326,9 @@ def get_spotify_artist_id(artist: str, spotify_token: str) -> str | None:
     search_url = "https://api.spotify.com/v1/search"
     params = {"q": f"artist:{artist}", "type": "artist", "limit": 1}
 
-    response = requests.get(search_url, headers=headers, params=params)
-    rate_limit()
+    status, data = await fetch_json(session, "spotify", search_url, headers=headers, params=params)
 
-    if response.status_code == 200:
-        data = response.json()
+    if data is not None:
         if data['artists']['items']:
             # Get the first matching artist ID
             artist_id = data['artists']['items'][0]['id']
@@ -120,15 +336,17 @@ def get_spotify_artist_id(artist: str, spotify_token: str) -> str | None:
         else:
             logging.error(f"No artist found on Spotify for '{artist}'")
     else:
-        logging.error(f"Failed to fetch artist ID from Spotify for '{artist}'. Status code: {response.status_code}")
+        logging.error(f"Failed to fetch artist ID from Spotify for '{artist}'. Status code: {status}")
 
     return None
 
-def fetch_cover_spotify(artist: str, album: str, spotify_token: str, release_year: str | None = None) -> str | None:
+@cached_cover("spotify")
+async def fetch_cover_spotify(session: aiohttp.ClientSession, artist: str, album: str, spotify_token: str, release_year: str | None = None) -> str | None:
     """
     Fetch cover URL from Spotify with stricter verification, considering album types.
 
     Args:
+        session (aiohttp.ClientSession): The HTTP session to use for the requests.
         artist (str): The artist name to search for.
         album (str): The album name to search for.
         spotify_token (str): The Spotify API token to use for authentication.
@@ -139,37 +357,51 @@ def fetch_cover_spotify(artist: str, album: str, spotify_token: str, release_yea
     """
     headers = {"Authorization": f"Bearer {spotify_token}"}
     search_url = "https://api.spotify.com/v1/search"
+    artist_key = match_key(normalize_artist_name(artist))
+    album_key = match_key(album)
 
-    for variant in [album] + [f"{album} {suffix}" for suffix in TITLE_VARIANTS]:
-        params = {"q": f"album:{variant} artist:{artist}", "type": "album"}
-        response = requests.get(search_url, headers=headers, params=params)
-        rate_limit()
-
-        if response.status_code == 200:
-            data = response.json()
-            if data['albums']['items']:
-                for album_data in data['albums']['items']:
-                    album_name = album_data['name']
-                    artist_name = album_data['artists'][0]['name']
-                    album_type = album_data.get('album_type')
-                    album_release_date = album_data.get('release_date', '').split('-')[0]  # Extract year
+    # A single search with a large limit covers the Deluxe/Remastered/... editions as well,
+    # the fuzzy matching below picks the right one
+    params = {"q": f"artist:{quote_term(artist)} album:{quote_term(album)}", "type": "album", "limit": 50}
+    try:
+        status, data = await fetch_json(session, "spotify", search_url, headers=headers, params=params)
+    except aiohttp.ClientResponseError as e:
+        # The token may have been revoked before it expired, so get a fresh one and retry once
+        if e.status != 401:
+            raise
+        spotify_token = await refresh_spotify_token(session, spotify_token)
+        if not spotify_token:
+            raise
+        headers = {"Authorization": f"Bearer {spotify_token}"}
+        status, data = await fetch_json(session, "spotify", search_url, headers=headers, params=params)
+
+    if data is not None:
+        items = data['albums']['items']
+        if items:
+            # Score all returned albums at once and check the matches in the order Spotify ranked them
+            matches = (fuzzy_matches(artist_key, [match_key(normalize_artist_name(item['artists'][0]['name'])) for item in items], threshold=90) &
+                       fuzzy_matches(album_key, [match_key(item['name']) for item in items]))
+            for index in sorted(matches):
+                album_data = items[index]
+                album_type = album_data.get('album_type')
+                album_release_date = album_data.get('release_date', '').split('-')[0]  # Extract year
 
-                    # Validate the album type (album, ep, compilation, live)
-                    if (fuzzy_match(artist, artist_name, threshold=90) and
-                            fuzzy_match(album, album_name) and
-                            album_type in ALBUM_TYPES and
-                            (release_year is None or album_release_date == release_year)):
-                        logging.info(f"Found matching cover on Spotify for '{album}' by '{artist}'")
-                        return album_data['images'][0]['url']  # Get the largest image
-        else:
-            logging.error(f"Failed to fetch from Spotify. Status code: {response.status_code}")
+                # Validate the album type (album, ep, compilation, live)
+                if (album_type in ALBUM_TYPES and
+                        (release_year is None or album_release_date == release_year)):
+                    logging.info(f"Found matching cover on Spotify for '{album}' by '{artist}'")
+                    return album_data['images'][0]['url']  # Get the largest image
+    else:
+        logging.error(f"Failed to fetch from Spotify. Status code: {status}")
 
     return None
 
-def fetch_cover_deezer(artist: str, album: str, release_year: str | None = None) -> str | None:
+@cached_cover("deezer")
+async def fetch_cover_deezer(session: aiohttp.ClientSession, artist: str, album: str, release_year: str | None = None) -> str | None:
     """Fetch cover URL from Deezer with stricter verification, considering album types.
 
     Args:
+        session (aiohttp.ClientSession): The HTTP session to use for the requests.
         artist (str): The artist name to search for.
         album (str): The album name to search for.
         release_year (str | None, optional): The release year of the album to search for. Defaults to None.
@@ -177,38 +409,48 @@ def fetch_cover_deezer(artist: str, album: str, release_year: str | None = None)
     Returns:
         str | None: The Deezer album cover URL if found, or None if not.
     """
+    artist_key = match_key(normalize_artist_name(artist))
+    album_key = match_key(album)
+
     # Iterate through the given album title and its variants (e.g. "The Dark Side of the Moon" and "The Dark Side of the Moon (Deluxe Edition)")
-    for album_variant in [album] + [f"{album} {suffix}" for suffix in TITLE_VARIANTS]:
-        # Construct the API URL with the query parameters
-        response = requests.get(f"{DEEZER_API_URL}search/album?q=artist:'{artist}' album:'{album_variant}'")
-        rate_limit()  # Avoid hitting the rate limit
+    for suffix in TITLE_SUFFIXES:
+        album_variant = album + suffix
+        # Let aiohttp URL-encode the query instead of interpolating it into the URL
+        params = {"q": f"artist:{quote_term(artist)} album:{quote_term(album_variant)}"}
+        status, data = await fetch_json(session, "deezer", f"{DEEZER_API_URL}search/album", params=params)
+
+        # Deezer reports errors such as an exceeded quota with HTTP 200 and an error object
+        if data is not None and 'error' in data:
+            raise ProviderError(f"Deezer error: {data['error']}")
 
         # Check if the API call was successful
-        if response.status_code == 200:
-            data = response.json()
-            if data['data']:  # Check if the API returned any data
-                album_data = data['data'][0]
-                album_name = album_data['title']
-                artist_name = album_data['artist']['name']
-                album_type = album_data.get('record_type')
-                album_release_date = album_data.get('release_date', '').split('-')[0]  # Extract year
+        if data is not None:
+            items = data['data']
+            if items:  # Check if the API returned any data
+                # Score all returned albums at once and check the matches in the order Deezer ranked them
+                matches = (fuzzy_matches(artist_key, [match_key(normalize_artist_name(item['artist']['name'])) for item in items], threshold=90) &
+                           fuzzy_matches(album_key, [match_key(item['title']) for item in items]))
+                for index in sorted(matches):
+                    album_data = items[index]
+                    album_type = album_data.get('record_type')
+                    album_release_date = album_data.get('release_date', '').split('-')[0]  # Extract year
 
-                # Validate the album type (album, ep, compilation, live)
-                if (fuzzy_match(artist, artist_name, threshold=90) and
-                        fuzzy_match(album, album_name) and
-                        album_type in ALBUM_TYPES and
-                        (release_year is None or album_release_date == release_year)):
-                    logging.info(f"Found matching cover on Deezer for '{album}' by '{artist}'")
-                    return album_data['cover_big']  # Get the largest image
+                    # Validate the album type (album, ep, compilation, live)
+                    if (album_type in ALBUM_TYPES and
+                            (release_year is None or album_release_date == release_year)):
+                        logging.info(f"Found matching cover on Deezer for '{album}' by '{artist}'")
+                        return album_data['cover_big']  # Get the largest image
         else:
-            logging.error(f"Failed to fetch from Deezer. Status code: {response.status_code}")
+            logging.error(f"Failed to fetch from Deezer. Status code: {status}")
 
     return None
 
-def fetch_cover_lastfm(artist: str, album: str) -> str | None:
+@cached_cover("lastfm")
+async def fetch_cover_lastfm(session: aiohttp.ClientSession, artist: str, album: str) -> str | None:
     """Fetch cover URL from Last.fm.
 
     Args:
+        session (aiohttp.ClientSession): The HTTP session to use for the request.
         artist (str): The artist name to search for.
         album (str): The album name to search for.
 
@@ -224,11 +466,9 @@ def fetch_cover_lastfm(artist: str, album: str) -> str | None:
         'format': 'json'
     }
 
-    response = requests.get(url, params=params)
-    rate_limit()
+    status, data = await fetch_json(session, "lastfm", url, params=params)
 
-    if response.status_code == 200:
-        data = response.json()
+    if data is not None:
         if 'album' in data and 'image' in data['album']:
             images = data['album']['image']
             for img in images:
@@ -238,33 +478,47 @@ def fetch_cover_lastfm(artist: str, album: str) -> str | None:
     logging.info(f"No matches found on Last.fm for '{album}' by '{artist}'")
     return None
 
-def fetch_cover_discogs(artist, album):
+@cached_cover("discogs")
+async def fetch_cover_discogs(session, artist, album):
     """Fetch cover URL from Discogs with stricter verification.
 
-    We use the Discogs API to search for the album by the given artist and
-    album name. We then extract the first image from the first result and
-    return its URL.
+    We use the Discogs database search to look for the album by the given
+    artist and album name. The search results already contain the URL of the
+    cover image, so we return the one of the first result without fetching
+    the release itself.
 
     Args:
+        session (aiohttp.ClientSession): The HTTP session to use for the request.
         artist (str): The artist name to search for.
         album (str): The album name to search for.
 
     Returns:
         str | None: The URL of the album cover if found, or None if not.
     """
-    discogs_api = discogs_client.Client('MusicTriviaApp', user_token=DISCOGS_API_TOKEN)
-    try:
-        results = discogs_api.search(album, artist=artist, type='release')
-        rate_limit()
-
-        if results.count > 0:
-            release = results[0]
-            return release.images[0]['uri']
-    except Exception as e:
-        logging.error(f"Error fetching cover from Discogs for '{album}' by '{artist}': {e}")
+    headers = {
+        'User-Agent': 'MusicTriviaApp/1.0',
+        'Authorization': f"Discogs token={DISCOGS_API_TOKEN}",
+    }
+    params = {'artist': artist, 'release_title': album, 'type': 'release', 'per_page': 5}
+
+    status, data = await fetch_json(session, "discogs", f"{DISCOGS_API_URL}database/search", headers=headers, params=params)
+
+    if data is not None:
+        results = data.get('results')
+        if results:
+            cover_url = results[0].get('cover_image')
+            # Releases without artwork come with a placeholder image
+            if cover_url and not cover_url.endswith('spacer.gif'):
+                logging.info(f"Found cover on Discogs for '{album}' by '{artist}'")
+                return cover_url
+    else:
+        logging.error(f"Failed to fetch from Discogs for '{album}' by '{artist}'. Status code: {status}")
+
+    logging.info(f"No matches found on Discogs for '{album}' by '{artist}'")
     return None
 
-def fetch_cover_musicbrainz(artist, album):
+@cached_cover("musicbrainz")
+async def fetch_cover_musicbrainz(session, artist, album):
     """Fetch cover URL from MusicBrainz.
 
     We use the MusicBrainz API to search for the album by the given artist and
@@ -274,6 +528,7 @@ def fetch_cover_musicbrainz(artist, album):
     it is.
 
     Args:
+        session (aiohttp.ClientSession): The HTTP session to use for the requests.
         artist (str): The artist name to search for.
         album (str): The album name to search for.
 
@@ -281,21 +536,22 @@ def fetch_cover_musicbrainz(artist, album):
         str | None: The URL of the album cover if found, or None if not.
     """
     headers = {'User-Agent': 'MusicTriviaApp/1.0 (example@example.com)'}
-    query = f"artist:{artist} AND release:{album}"
+    query = f"artist:{quote_term(artist)} AND release:{quote_term(album)}"
     params = {'query': query, 'fmt': 'json', 'limit': 1}
 
-    response = requests.get(f"{MUSICBRAINZ_API_URL}release", headers=headers, params=params)
-    rate_limit()
+    status, data = await fetch_json(session, "musicbrainz", f"{MUSICBRAINZ_API_URL}release", headers=headers, params=params)
 
-    if response.status_code == 200:
-        data = response.json()
+    if data is not None:
         if 'releases' in data and len(data['releases']) > 0:
             release_id = data['releases'][0]['id']
             cover_url = f"https://coverartarchive.org/release/{release_id}/front-500"
 
-            # Check if the image is available before returning the URL
-            head_response = requests.head(cover_url)
-            if head_response.status_code == 404:
+            # Check if the image is available before returning the URL. This lookup runs concurrently
+            # with the other providers, so the extra round trip does not delay them, and aiohttp does
+            # not follow the archive's redirect to the image host for HEAD requests.
+            async with session.head(cover_url) as head_response:
+                head_status = head_response.status
+            if head_status == 404:
                 logging.error(f"Cover not found on Cover Art Archive for '{album}' by '{artist}'. HTTP Status: 404")
                 return None
             logging.info(f"Found cover on MusicBrainz for '{album}' by '{artist}'")
@@ -307,6 +563,9 @@ def fetch_cover_musicbrainz(artist, album):
 def download_and_resize_image(url: str, output_path: str) -> bool:
     """Download an image from the given URL and resize it to 300x300 pixels.
 
+    Images that already are 300x300 RGB JPEGs are saved as downloaded, without
+    decoding and encoding them again.
+
     Args:
         url (str): The URL of the image to download.
         output_path (str): The path to save the resized image.
@@ -317,111 +576,235 @@ def download_and_resize_image(url: str, output_path: str) -> bool:
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
     }
+    download_path = f"{output_path}.part"
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            # Read the image from the response content
-            img = Image.open(BytesIO(response.content))
-
-            # Resize the image to 300x300 pixels
-            img = img.resize((300, 300))
-
-            # Convert 'RGBA' mode to 'RGB' to save as JPEG
-            if img.mode == 'RGBA':
-                img = img.convert('RGB')
+        with http_session.get(url, headers=headers, stream=True, timeout=10) as response:
+            if response.status_code != 200:
+                logging.error(f"Failed to download image from {url}. HTTP Status: {response.status_code}")
+                return False
 
             # Ensure directory exists
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-            # Save the resized image to the given path
-            img.save(output_path)
-        else:
-            logging.error(f"Failed to download image from {url}. HTTP Status: {response.status_code}")
-            return False
-    except requests.exceptions.RequestException as e:
+            # Stream the image to disk without buffering the body in memory
+            response.raw.decode_content = True
+            with open(download_path, 'wb') as file:
+                shutil.copyfileobj(response.raw, file)
+
+        with Image.open(download_path) as img:
+            # Covers that already have the target size and format are kept as they are
+            already_resized = img.format == 'JPEG' and img.size == (300, 300) and img.mode == 'RGB'
+
+            if not already_resized:
+                # Let the JPEG decoder downscale while decoding (DCT scaling), keeping headroom for a sharp resize
+                img.draft('RGB', (600, 600))
+
+                # Resize the image to 300x300 pixels
+                resized = img.resize((300, 300), Image.Resampling.LANCZOS)
+
+                # Convert 'RGBA', 'P', 'CMYK', ... to 'RGB' to save as JPEG
+                if resized.mode != 'RGB':
+                    resized = resized.convert('RGB')
+
+                # Save the resized image to the given path
+                resized.save(output_path, 'JPEG', quality=85, optimize=True, progressive=True)
+
+        if already_resized:
+            os.replace(download_path, output_path)
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
         logging.error(f"Error while downloading image from {url}: {e}")
         return False
+    except OSError as e:
+        logging.error(f"Could not process image from {url}: {e}")
+        return False
+    finally:
+        # Remove the downloaded original unless it was moved into place
+        if os.path.exists(download_path):
+            os.remove(download_path)
     return True
 
-def process_json(file_path):
-    """Process the JSON file, checking for missing covers and downloading them."""
-    spotify_token = authenticate_spotify()
+async def fetch_cover(session: aiohttp.ClientSession, artist: str, album: str, release_year: str | None, spotify_token: str | None) -> str | None:
+    """Query all cover providers concurrently and return the best available cover URL.
 
-    json_filename = os.path.basename(file_path)
-    genre = os.path.splitext(json_filename)[0]
+    Providers are ranked Spotify, Deezer, Last.fm, Discogs and MusicBrainz. As
+    soon as the highest ranked provider that is still pending returns a cover,
+    the remaining lookups are cancelled.
 
-    with open(file_path, 'r') as file:
-        data = json.load(file)
+    Args:
+        session (aiohttp.ClientSession): The HTTP session to use for the requests.
+        artist (str): The artist name to search for.
+        album (str): The album name to search for.
+        release_year (str | None): The release year of the album, if known.
+        spotify_token (str | None): The Spotify API token, or None to skip Spotify.
 
-    for album_data in data:
-        artist = album_data['artist']
-        album = album_data['album']
-        release_year = album_data.get('year')
-        cover_src = album_data.get('coverSrc')
+    Returns:
+        str | None: The URL of the album cover if found, or None if not.
+    """
+    lookups = []
+    if spotify_token:
+        lookups.append(("Spotify", fetch_cover_spotify(session, artist, album, spotify_token, release_year)))
+    lookups.append(("Deezer", fetch_cover_deezer(session, artist, album, release_year)))
+    lookups.append(("Last.fm", fetch_cover_lastfm(session, artist, album)))
+    lookups.append(("Discogs", fetch_cover_discogs(session, artist, album)))
+    lookups.append(("Cover Art Archive", fetch_cover_musicbrainz(session, artist, album)))
+
+    tasks = [(source, asyncio.create_task(lookup)) for source, lookup in lookups]
+    try:
+        for source, task in tasks:
+            try:
+                cover_url = await task
+            except (aiohttp.ClientError, asyncio.TimeoutError, ProviderError) as e:
+                logging.error(f"Error fetching cover from {source} for '{album}' by '{artist}': {e}")
+                continue
+            except (KeyError, IndexError, ValueError) as e:
+                # An unexpected response (missing fields, no images, invalid JSON) only skips this provider
+                logging.error(f"Unexpected response from {source} for '{album}' by '{artist}': {e!r}")
+                continue
+            if cover_url:
+                logging.info(f"Found cover for '{album}' by '{artist}' on {source}.")
+                return cover_url
+    finally:
+        # Stop the lower ranked lookups once a cover has been found
+        for _, task in tasks:
+            task.cancel()
+
+    logging.error(f"Cover not found on any source for '{album}' by '{artist}'")
+    return None
 
-        # Add coverSrc field if missing
-        if not cover_src:
-            album_data['coverSrc'] = ""
+def load_json(file_path: str) -> list[dict]:
+    """Load the album entries from a JSON file, using orjson when it is installed.
 
-        slugified_filename = slugify(f"{artist}_{album}") + ".jpg"
-        output_path = os.path.join("bandcover", genre, slugified_filename)
+    Args:
+        file_path (str): The path to the JSON file.
 
-        if cover_src and os.path.exists(cover_src):
-            continue
+    Returns:
+        list[dict]: The album entries.
+    """
+    if orjson is not None:
+        with open(file_path, 'rb') as file:
+            return orjson.loads(file.read())
 
-        if os.path.exists(output_path):
-            album_data['coverSrc'] = f"/{output_path}"
-            continue
+    with open(file_path, 'r', encoding='utf-8') as file:
+        return json.load(file)
 
-        # Try to fetch the cover from different sources
-        cover_url = None
-        logging.info(f"Attempting to fetch cover for '{album}' by '{artist}'")
+def save_json(file_path: str, data: list[dict]) -> None:
+    """Save the album entries to a JSON file, using orjson when it is installed.
 
-        # Spotify
-        if spotify_token:
-            cover_url = fetch_cover_spotify(artist, album, spotify_token, release_year)
-            if cover_url:
-                logging.info(f"Found cover for '{album}' by '{artist}' on Spotify.")
+    Args:
+        file_path (str): The path to the JSON file.
+        data (list[dict]): The album entries to save.
+    """
+    if orjson is not None:
+        with open(file_path, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
 
-        # Deezer
-        if not cover_url:
-            cover_url = fetch_cover_deezer(artist, album, release_year)
-            if cover_url:
-                logging.info(f"Found cover for '{album}' by '{artist}' on Deezer.")
+    with open(file_path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2)
 
-        # Last.fm
-        if not cover_url:
-            cover_url = fetch_cover_lastfm(artist, album)
-            if cover_url:
-                logging.info(f"Found cover for '{album}' by '{artist}' on Last.fm.")
+def find_missing_cover(album_data: dict, genre: str, existing_covers: set[str]) -> str | None:
+    """Check whether a cover for the album entry is already available.
 
-        # Discogs
-        if not cover_url:
-            cover_url = fetch_cover_discogs(artist, album)
-            if cover_url:
-                logging.info(f"Found cover for '{album}' by '{artist}' on Discogs.")
+    Args:
+        album_data (dict): The album entry from the JSON file, updated in place.
+        genre (str): The genre, used as the sub directory of the cover images.
+        existing_covers (set[str]): The file names already present in the genre's cover directory.
 
-        # MusicBrainz/Cover Art Archive
-        if not cover_url:
-            cover_url = fetch_cover_musicbrainz(artist, album)
-            if cover_url:
-                logging.info(f"Found cover for '{album}' by '{artist}' on Cover Art Archive.")
-            else:
-                logging.error(f"Cover not found on Cover Art Archive for '{album}' by '{artist}'")
-                # If no cover is found, use the default cover image
-                logging.info(f"Using default cover image for '{album}' by '{artist}'")
-                album_data['coverSrc'] = "/default-cover.jpg"
-
-        # Download and resize image if cover URL found
-        if cover_url:
-            if not download_and_resize_image(cover_url, output_path):
-                logging.error(f"Could not download cover for '{album}' by '{artist}'")
-            else:
-                album_data['coverSrc'] = f"/{output_path}"
+    Returns:
+        str | None: The output path for the cover if it is missing, or None if it is already available.
+    """
+    artist = album_data['artist']
+    album = album_data['album']
+    cover_src = album_data.get('coverSrc')
+
+    # Add coverSrc field if missing
+    if not cover_src:
+        album_data['coverSrc'] = ""
+
+    slugified_filename = slugify(f"{artist}_{album}") + ".jpg"
+    output_path = os.path.join("bandcover", genre, slugified_filename)
+
+    if cover_src and os.path.exists(cover_src):
+        return None
+
+    if slugified_filename in existing_covers:
+        album_data['coverSrc'] = f"/{output_path}"
+        return None
+
+    return output_path
+
+async def lookup_album_cover(session: aiohttp.ClientSession, executor: ThreadPoolExecutor, entries: list[dict], output_path: str, spotify_token: str | None, album_slots: asyncio.Semaphore) -> None:
+    """Look up the cover of an album and download it as soon as it is found.
+
+    The download runs in the thread pool while the lookups of the other albums
+    continue, so finished covers land on disk throughout the run.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session to use for the requests.
+        executor (ThreadPoolExecutor): The thread pool that downloads and resizes the covers.
+        entries (list[dict]): The album entries from the JSON file that share the cover, updated in place.
+        output_path (str): The path to save the cover to.
+        spotify_token (str | None): The Spotify API token, or None to skip Spotify.
+        album_slots (asyncio.Semaphore): Limits the number of albums looked up at the same time.
+    """
+    artist = entries[0]['artist']
+    album = entries[0]['album']
+    release_year = entries[0].get('year')
+
+    async with album_slots:
+        # Try to fetch the cover from different sources
+        logging.info(f"Attempting to fetch cover for '{album}' by '{artist}'")
+        cover_url = await fetch_cover(session, artist, album, release_year, spotify_token)
+
+    if not cover_url:
+        # If no cover is found, use the default cover image
+        logging.info(f"Using default cover image for '{album}' by '{artist}'")
+        for album_data in entries:
+            album_data['coverSrc'] = "/default-cover.jpg"
+        return
+
+    # Download and resize the image without blocking the lookups of the other albums
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(executor, download_and_resize_image, cover_url, output_path):
+        logging.error(f"Could not download cover for '{album}' by '{artist}'")
+        return
+    for album_data in entries:
+        album_data['coverSrc'] = f"/{output_path}"
+
+async def process_json(file_path):
+    """Process the JSON file, checking for missing covers and downloading them."""
+    json_filename = os.path.basename(file_path)
+    genre = os.path.splitext(json_filename)[0]
+
+    data = load_json(file_path)
+
+    # List the cover directory once instead of checking every album's file separately
+    cover_dir = os.path.join("bandcover", genre)
+    existing_covers = set(os.listdir(cover_dir)) if os.path.isdir(cover_dir) else set()
+
+    # Group the album entries without a cover by their output path, so duplicate entries are fetched once
+    missing = {}
+    for album_data in data:
+        output_path = find_missing_cover(album_data, genre, existing_covers)
+        if output_path:
+            missing.setdefault(output_path, []).append(album_data)
+
+    # Only talk to the APIs if there are covers left to fetch
+    if missing:
+        connector = aiohttp.TCPConnector(limit=20)
+        timeout = aiohttp.ClientTimeout(total=30)
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                spotify_token = await get_spotify_token(session)
+
+                album_slots = asyncio.Semaphore(ALBUM_CONCURRENCY)
+                await asyncio.gather(
+                    *(lookup_album_cover(session, executor, entries, output_path, spotify_token, album_slots)
+                      for output_path, entries in missing.items())
+                )
 
     # Save the updated JSON
-    with open(file_path, 'w') as file:
-        json.dump(data, file, indent=2)
+    save_json(file_path, data)
 
     logging.info(f"Updated JSON saved to {file_path}")
 
@@ -432,4 +815,4 @@ if __name__ == "__main__":
     parser.add_argument("file_path", help="Path to the JSON file")
     args = parser.parse_args()
 
-    process_json(args.file_path)
+    asyncio.run(process_json(args.file_path))